@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
 
+import httpx
 import instructor
 from instructor import Mode
-import logfire
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, OpenAI
 
 from settings import Settings
 from models import (
@@ -17,27 +20,50 @@ from models import (
     RebuttalParagraphs,
     ReferencedParagraphs,
     EvidenceBasedResponse,
+    BatchRunResult,
+    CombinedPointsResponse,
+    CombinedRebuttalResponse,
 )
-from decorators import span
-from evidence import gather_evidence, GatheredEvidence
+from decorators import log_debug, span
+from evidence import gather_evidence, gather_evidence_async, GatheredEvidence
+
+
+MISTRAL_BASE_URL = "https://api.mistral.ai/v1"
+MISTRAL_BATCH_FINAL_STATUSES = {"SUCCESS", "FAILED", "TIMEOUT_EXCEEDED", "CANCELLED"}
 
 
 def build_client(settings: Settings) -> Any:
-    client = OpenAI(base_url="https://api.mistral.ai/v1", api_key=settings.mistral_api_key)
-    try:
-        logfire.instrument_openai()
-    except Exception:
-        pass
-    # Use JSON mode to avoid tool/function-calling issues with some providers
-    return instructor.from_openai(client, mode=Mode.JSON)
+    client = OpenAI(base_url=MISTRAL_BASE_URL, api_key=settings.mistral_api_key)
+    # JSON-schema mode sends the response_model schema as response_format. Instructor
+    # does not mark it strict, so Mistral treats it as guidance rather than enforcing it;
+    # malformed replies are still caught by validation and re-asked via max_retries.
+    return instructor.from_openai(client, mode=Mode.JSON_SCHEMA)
+
+
+def build_async_client(settings: Settings) -> Any:
+    """
+    Async counterpart of build_client, for use with the *_async pipeline functions.
+
+    Share one client across a run: concurrent calls are multiplexed over its
+    HTTP/2 connection instead of each opening their own.
+    """
+    client = AsyncOpenAI(
+        base_url=MISTRAL_BASE_URL,
+        api_key=settings.mistral_api_key,
+        http_client=DefaultAsyncHttpxClient(http2=True),
+    )
+    return instructor.from_openai(client, mode=Mode.JSON_SCHEMA)
 
 
 def opposite_side(side: DebateSide) -> DebateSide:
     return DebateSide.con if side == DebateSide.pro else DebateSide.pro
 
 
-@span("understand_arguments")
-def understand_arguments(submission: StudentSubmission, client: Any, settings: Settings) -> UnderstoodArguments:
+def _understand_attrs(submission: StudentSubmission) -> Dict[str, Any]:
+    return {"motion": submission.motion, "student_side": submission.student_side.value}
+
+
+def _understand_messages(submission: StudentSubmission) -> List[Dict[str, str]]:
     system = (
         "You are a world-class debate analyst. Your job is to accurately understand the student's argument. "
         "Do not argue yet. Identify the core claims and key supporting points succinctly."
@@ -52,9 +78,14 @@ def understand_arguments(submission: StudentSubmission, client: Any, settings: S
         + "\nStudent argument:\n"
         + submission.argument_text
     )
+    return [{"role": "system", "content": system}, {"role": "user", "content": msg_user}]
+
+
+@span("understand_arguments")
+def understand_arguments(submission: StudentSubmission, client: Any, settings: Settings) -> UnderstoodArguments:
     understood: UnderstoodArguments = client.chat.completions.create(
         model=settings.model,
-        messages=[{"role": "system", "content": system}, {"role": "user", "content": msg_user}],
+        messages=_understand_messages(submission),
         temperature=0.2,
         max_tokens=800,
         parallel_tool_calls=False,
@@ -65,16 +96,25 @@ def understand_arguments(submission: StudentSubmission, client: Any, settings: S
     return understood
 
 
-@span("generate_counter")
-def generate_counter(
-    submission: StudentSubmission,
-    understood: UnderstoodArguments,
-    client: Any,
-    settings: Settings,
-) -> PointsResponse | RebuttalParagraphs | ReferencedParagraphs:
-    agent_side = opposite_side(submission.student_side)
+@span("understand_arguments")
+async def understand_arguments_async(
+    submission: StudentSubmission, client: Any, settings: Settings
+) -> UnderstoodArguments:
+    understood: UnderstoodArguments = await client.chat.completions.create(
+        model=settings.model,
+        messages=_understand_messages(submission),
+        temperature=0.2,
+        max_tokens=800,
+        parallel_tool_calls=False,
+        timeout=30.0,
+        max_retries=2,
+        response_model=UnderstoodArguments,
+    )
+    return understood
+
 
-    base_instructions = (
+def _counter_preamble(submission: StudentSubmission, agent_side: DebateSide) -> str:
+    return (
         """
         <persistence>
         You are a professional debate candidate familiar with teh Platonic ways of making arguments such that your arguments are well articulated and clear for participants to understand. You are to base all of your arguments from existing evidence which means you follow strictly the </response-process>
@@ -111,6 +151,15 @@ def generate_counter(
         f"Debate motion: {submission.motion}\n"
         f"Student side: {submission.student_side.value}\n"
         f"Your side: {agent_side.value}\n"
+    )
+
+
+def _counter_base_instructions(
+    submission: StudentSubmission,
+    understood: UnderstoodArguments,
+    agent_side: DebateSide,
+) -> str:
+    return _counter_preamble(submission, agent_side) + (
         "First, ensure your counter-arguments directly address the student's actual claims summarized below.\n"
         f"Student summary: {understood.summary}\n"
         f"Key points: {understood.key_points}\n"
@@ -118,41 +167,174 @@ def generate_counter(
         "Be concise, precise, and avoid strawmanning."
     )
 
+
+def _counter_request(
+    submission: StudentSubmission,
+    understood: UnderstoodArguments,
+    agent_side: DebateSide,
+) -> Tuple[str, Type[PointsResponse] | Type[RebuttalParagraphs], int]:
+    """System prompt, response model and token budget for the non-evidence formats."""
+    base_instructions = _counter_base_instructions(submission, understood, agent_side)
+
     if submission.requested_format == OutputFormat.points:
         system = base_instructions + (
             "\nOutput format: POINTS. Return 3-6 strong counter-points.\n"
             "Each point may include a short support sentence in plain text.\n"
             "IMPORTANT: Return a JSON object only (no extra text) with a 'points' field."
         )
-        pts: PointsResponse = client.chat.completions.create(
-            model=settings.model,
-            messages=[{"role": "system", "content": system}],
-            temperature=0.1,
-            max_tokens=800,
-            parallel_tool_calls=False,
-            timeout=30.0,
-            max_retries=2,
-            response_model=PointsResponse,
-        )
-        return pts
+        return system, PointsResponse, 800
+
+    system = base_instructions + (
+        "\nOutput format: REBUTTAL_PARAGRAPHS. Provide 2-4 paragraphs.\n"
+        "Each paragraph should rebut a specific student claim and explain why it is weak or incomplete.\n"
+        "IMPORTANT: Return a JSON object only (no extra text) with a 'paragraphs' field."
+    )
+    return system, RebuttalParagraphs, 900
 
-    if submission.requested_format == OutputFormat.rebuttal_paragraphs:
+
+def _combined_request(
+    submission: StudentSubmission,
+    agent_side: DebateSide,
+) -> Tuple[str, Type[CombinedPointsResponse] | Type[CombinedRebuttalResponse], int]:
+    """System prompt, response model and token budget for the single-call analyse-then-counter flow."""
+    base_instructions = _counter_preamble(submission, agent_side) + (
+        f"Student argument:\n{submission.argument_text}\n"
+        "Work in two steps and return both in one JSON object.\n"
+        "Step A ('understood'): accurately understand the student's argument. Do not argue yet. "
+        "Give a succinct 'summary', the 'key_points' and the core 'detected_claims'.\n"
+        "Step B ('counter'): write counter-arguments that directly address the claims you identified in Step A.\n"
+        "Be concise, precise, and avoid strawmanning."
+    )
+
+    if submission.requested_format == OutputFormat.points:
         system = base_instructions + (
-            "\nOutput format: REBUTTAL_PARAGRAPHS. Provide 2-4 paragraphs.\n"
-            "Each paragraph should rebut a specific student claim and explain why it is weak or incomplete.\n"
-            "IMPORTANT: Return a JSON object only (no extra text) with a 'paragraphs' field."
+            "\nOutput format for 'counter': POINTS. Return 3-6 strong counter-points.\n"
+            "Each point may include a short support sentence in plain text.\n"
+            "IMPORTANT: Return a JSON object only (no extra text) with 'understood' and 'counter' fields; "
+            "'counter' has a 'points' field."
         )
-        paras: RebuttalParagraphs = client.chat.completions.create(
+        return system, CombinedPointsResponse, 1600
+
+    system = base_instructions + (
+        "\nOutput format for 'counter': REBUTTAL_PARAGRAPHS. Provide 2-4 paragraphs.\n"
+        "Each paragraph should rebut a specific student claim and explain why it is weak or incomplete.\n"
+        "IMPORTANT: Return a JSON object only (no extra text) with 'understood' and 'counter' fields; "
+        "'counter' has a 'paragraphs' field."
+    )
+    return system, CombinedRebuttalResponse, 1700
+
+
+@span("analyze_and_counter")
+def analyze_and_counter(
+    submission: StudentSubmission,
+    client: Any,
+    settings: Settings,
+) -> CombinedPointsResponse | CombinedRebuttalResponse:
+    """
+    Understand the student's argument and counter it in a single LLM call.
+
+    Only for points / rebuttal_paragraphs; referenced_paragraphs needs evidence
+    gathered between the two steps and keeps the two-call path.
+    """
+    if submission.requested_format == OutputFormat.referenced_paragraphs:
+        raise ValueError("analyze_and_counter does not support referenced_paragraphs; use generate_counter")
+
+    system, response_model, max_tokens = _combined_request(submission, opposite_side(submission.student_side))
+    return client.chat.completions.create(
+        model=settings.model,
+        messages=[{"role": "system", "content": system}],
+        temperature=0.1,
+        max_tokens=max_tokens,
+        parallel_tool_calls=False,
+        timeout=60.0,
+        max_retries=2,
+        response_model=response_model,
+    )
+
+
+@span("analyze_and_counter")
+async def analyze_and_counter_async(
+    submission: StudentSubmission,
+    client: Any,
+    settings: Settings,
+) -> CombinedPointsResponse | CombinedRebuttalResponse:
+    """Async variant of analyze_and_counter."""
+    if submission.requested_format == OutputFormat.referenced_paragraphs:
+        raise ValueError("analyze_and_counter does not support referenced_paragraphs; use generate_counter")
+
+    system, response_model, max_tokens = _combined_request(submission, opposite_side(submission.student_side))
+    return await client.chat.completions.create(
+        model=settings.model,
+        messages=[{"role": "system", "content": system}],
+        temperature=0.1,
+        max_tokens=max_tokens,
+        parallel_tool_calls=False,
+        timeout=60.0,
+        max_retries=2,
+        response_model=response_model,
+    )
+
+
+async def stream_rebuttal_paragraphs_async(
+    submission: StudentSubmission,
+    client: Any,
+    settings: Settings,
+) -> AsyncIterator[str]:
+    """
+    Single-call rebuttal that streams the response, yielding each paragraph
+    as soon as the model has finished writing it.
+
+    Not wrapped in @span: a span held open across ``yield`` would leak into the
+    consumer and could be closed from another context. Callers open the span
+    around their ``async for`` loop instead.
+    """
+    if submission.requested_format != OutputFormat.rebuttal_paragraphs:
+        raise ValueError("stream_rebuttal_paragraphs_async only supports rebuttal_paragraphs")
+
+    system, response_model, max_tokens = _combined_request(submission, opposite_side(submission.student_side))
+    paragraphs: List[str] = []
+    emitted = 0
+    async for partial in client.chat.completions.create_partial(
+        model=settings.model,
+        messages=[{"role": "system", "content": system}],
+        temperature=0.1,
+        max_tokens=max_tokens,
+        parallel_tool_calls=False,
+        timeout=60.0,
+        max_retries=2,
+        response_model=response_model,
+    ):
+        paragraphs = (partial.counter.paragraphs if partial.counter else None) or []
+        # A paragraph is final once the model has moved on to the next one.
+        while emitted < len(paragraphs) - 1:
+            yield paragraphs[emitted]
+            emitted += 1
+
+    for para in paragraphs[emitted:]:
+        yield para
+
+
+@span("generate_counter")
+def generate_counter(
+    submission: StudentSubmission,
+    understood: UnderstoodArguments,
+    client: Any,
+    settings: Settings,
+) -> PointsResponse | RebuttalParagraphs | ReferencedParagraphs:
+    agent_side = opposite_side(submission.student_side)
+
+    if submission.requested_format != OutputFormat.referenced_paragraphs:
+        system, response_model, max_tokens = _counter_request(submission, understood, agent_side)
+        return client.chat.completions.create(
             model=settings.model,
             messages=[{"role": "system", "content": system}],
             temperature=0.1,
-            max_tokens=900,
+            max_tokens=max_tokens,
             parallel_tool_calls=False,
             timeout=30.0,
             max_retries=2,
-            response_model=RebuttalParagraphs,
+            response_model=response_model,
         )
-        return paras
 
     # referenced_paragraphs - use evidence-first approach
     return generate_evidence_based_response(
@@ -164,30 +346,81 @@ def generate_counter(
     )
 
 
-@span("generate_evidence_based_response")
-def generate_evidence_based_response(
+@span("generate_counter")
+async def generate_counter_async(
     submission: StudentSubmission,
-    understood: UnderstoodArguments,
-    agent_side: DebateSide,
+    understood: Optional[UnderstoodArguments],
     client: Any,
     settings: Settings,
-) -> EvidenceBasedResponse:
+    evidence: Optional[GatheredEvidence] = None,
+) -> PointsResponse | RebuttalParagraphs | ReferencedParagraphs:
     """
-    Evidence-first approach for generating referenced paragraphs:
-    1. Search web for the topic
-    2. Gather real URLs with content
-    3. Summarize each source
-    4. Generate response ONLY from verified evidence
+    Async variant of generate_counter.
+
+    Pass ``understood=None`` to have the student's argument understood here.
+    For referenced_paragraphs that runs concurrently with gathering the
+    evidence, since neither depends on the other; already-gathered
+    ``evidence`` can be passed to skip the web search.
     """
-    # Step 1-3: Gather and summarize evidence from web search
-    evidence: GatheredEvidence = gather_evidence(
+    agent_side = opposite_side(submission.student_side)
+
+    if submission.requested_format != OutputFormat.referenced_paragraphs:
+        if understood is None:
+            understood = await understand_arguments_async(
+                submission=submission, client=client, settings=settings, span_attrs=_understand_attrs(submission)
+            )
+        system, response_model, max_tokens = _counter_request(submission, understood, agent_side)
+        return await client.chat.completions.create(
+            model=settings.model,
+            messages=[{"role": "system", "content": system}],
+            temperature=0.1,
+            max_tokens=max_tokens,
+            parallel_tool_calls=False,
+            timeout=30.0,
+            max_retries=2,
+            response_model=response_model,
+        )
+
+    gather_kwargs = dict(
         motion=submission.motion,
         side=agent_side.value,
         tavily_api_key=settings.tavily_api_key,
+        include_domains=settings.include_domains,
+        search_depth=settings.search_depth,
         client=client,
         model=settings.model,
     )
-    
+    if understood is None and evidence is None:
+        # Understanding the student and gathering evidence on the motion are independent.
+        understood, evidence = await asyncio.gather(
+            understand_arguments_async(
+                submission=submission, client=client, settings=settings, span_attrs=_understand_attrs(submission)
+            ),
+            gather_evidence_async(**gather_kwargs),
+        )
+    elif understood is None:
+        understood = await understand_arguments_async(
+            submission=submission, client=client, settings=settings, span_attrs=_understand_attrs(submission)
+        )
+    elif evidence is None:
+        evidence = await gather_evidence_async(**gather_kwargs)
+
+    return await generate_evidence_based_response_async(
+        submission=submission,
+        understood=understood,
+        agent_side=agent_side,
+        evidence=evidence,
+        client=client,
+        settings=settings,
+    )
+
+
+def _evidence_based_system_prompt(
+    submission: StudentSubmission,
+    understood: UnderstoodArguments,
+    agent_side: DebateSide,
+    evidence: GatheredEvidence,
+) -> str:
     if not evidence.sources:
         raise ValueError(
             "No evidence sources found. Please set TAVILY_API_KEY in .env to enable web search."
@@ -206,8 +439,7 @@ def generate_evidence_based_response(
     
     available_urls = [s.url for s in evidence.sources]
     
-    # Step 4: Generate response from verified evidence
-    system = f"""You are a professional debate candidate. You must construct your argument ONLY from the verified evidence provided below.
+    return f"""You are a professional debate candidate. You must construct your argument ONLY from the verified evidence provided below.
 
 Debate motion: {submission.motion}
 Student side: {submission.student_side.value}
@@ -235,7 +467,37 @@ INSTRUCTIONS:
 
 IMPORTANT: Return a JSON object with a 'paragraphs' field. Each paragraph has 'text' and 'references' (array with 'url', 'title', 'supporting_claim')."""
 
-    print(f"[generate] Building response from {len(evidence.sources)} verified sources...")
+
+@span("generate_evidence_based_response")
+def generate_evidence_based_response(
+    submission: StudentSubmission,
+    understood: UnderstoodArguments,
+    agent_side: DebateSide,
+    client: Any,
+    settings: Settings,
+) -> EvidenceBasedResponse:
+    """
+    Evidence-first approach for generating referenced paragraphs:
+    1. Search web for the topic
+    2. Gather real URLs with content
+    3. Summarize each source
+    4. Generate response ONLY from verified evidence
+    """
+    # Step 1-3: Gather and summarize evidence from web search
+    evidence: GatheredEvidence = gather_evidence(
+        motion=submission.motion,
+        side=agent_side.value,
+        tavily_api_key=settings.tavily_api_key,
+        include_domains=settings.include_domains,
+        search_depth=settings.search_depth,
+        client=client,
+        model=settings.model,
+    )
+    
+    # Step 4: Generate response from verified evidence
+    system = _evidence_based_system_prompt(submission, understood, agent_side, evidence)
+
+    log_debug("[generate] Building response from {count} verified sources", count=len(evidence.sources))
     
     response: EvidenceBasedResponse = client.chat.completions.create(
         model=settings.model,
@@ -249,3 +511,217 @@ IMPORTANT: Return a JSON object with a 'paragraphs' field. Each paragraph has 't
     )
     
     return response
+
+
+@span("generate_evidence_based_response")
+async def generate_evidence_based_response_async(
+    submission: StudentSubmission,
+    understood: UnderstoodArguments,
+    agent_side: DebateSide,
+    evidence: GatheredEvidence,
+    client: Any,
+    settings: Settings,
+) -> EvidenceBasedResponse:
+    """Async variant of generate_evidence_based_response, from already-gathered evidence."""
+    system = _evidence_based_system_prompt(submission, understood, agent_side, evidence)
+
+    log_debug("[generate] Building response from {count} verified sources", count=len(evidence.sources))
+    
+    response: EvidenceBasedResponse = await client.chat.completions.create(
+        model=settings.model,
+        messages=[{"role": "system", "content": system}],
+        temperature=0.1,
+        max_tokens=1500,
+        parallel_tool_calls=False,
+        timeout=60.0,
+        max_retries=3,
+        response_model=EvidenceBasedResponse,
+    )
+    
+    return response
+
+
+def _strict_schema(schema: Any) -> Any:
+    """Close every object in a JSON schema (additionalProperties: false), as strict mode expects."""
+    if isinstance(schema, dict):
+        strict = {k: _strict_schema(v) for k, v in schema.items()}
+        if strict.get("type") == "object":
+            strict["additionalProperties"] = False
+        return strict
+    if isinstance(schema, list):
+        return [_strict_schema(v) for v in schema]
+    return schema
+
+
+def _batch_body(
+    messages: List[Dict[str, str]],
+    response_model: Type[Any],
+    temperature: float,
+    max_tokens: int,
+) -> Dict[str, Any]:
+    """
+    Chat completion body for a batch line.
+
+    Batch output bypasses instructor and gets no re-ask, so the schema is sent
+    with ``strict: true`` for Mistral to enforce it while decoding.
+    """
+    return {
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": response_model.__name__,
+                "schema": _strict_schema(response_model.model_json_schema()),
+                "strict": True,
+            },
+        },
+    }
+
+
+def _run_mistral_batch(
+    http: httpx.Client,
+    bodies: Dict[str, Dict[str, Any]],
+    settings: Settings,
+    poll_interval: float,
+) -> Dict[str, str]:
+    """
+    Run one Mistral batch job over ``custom_id -> body`` and return ``custom_id -> message content``.
+
+    Requests that failed inside an otherwise successful job are simply absent from the result.
+    """
+    if not bodies:
+        return {}
+
+    jsonl = "\n".join(json.dumps({"custom_id": cid, "body": body}) for cid, body in bodies.items())
+    upload = http.post(
+        "/files",
+        files={"file": ("batch.jsonl", jsonl.encode("utf-8"), "application/jsonl")},
+        data={"purpose": "batch"},
+    )
+    upload.raise_for_status()
+
+    created = http.post(
+        "/batch/jobs",
+        json={
+            "input_files": [upload.json()["id"]],
+            "model": settings.model,
+            "endpoint": "/v1/chat/completions",
+        },
+    )
+    created.raise_for_status()
+    job = created.json()
+    log_debug("[batch] Submitted job {job_id} with {count} requests", job_id=job["id"], count=len(bodies))
+
+    while job["status"] not in MISTRAL_BATCH_FINAL_STATUSES:
+        time.sleep(poll_interval)
+        polled = http.get(f"/batch/jobs/{job['id']}")
+        polled.raise_for_status()
+        job = polled.json()
+
+    if job["status"] != "SUCCESS" or not job.get("output_file"):
+        raise RuntimeError(f"Mistral batch job {job['id']} ended with status {job['status']}")
+
+    output = http.get(f"/files/{job['output_file']}/content")
+    output.raise_for_status()
+
+    contents: Dict[str, str] = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        contents[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+    return contents
+
+
+@span("batch_run")
+def batch_run(
+    submissions: List[StudentSubmission],
+    settings: Settings,
+    poll_interval: float = 10.0,
+) -> List[BatchRunResult]:
+    """
+    Run many submissions through the Mistral Batch API at the reduced batch price.
+
+    Stage 1 (understand) for every submission goes out as one batch job and
+    stage 2 (counter) as a second, since each counter prompt needs its
+    understanding. Outputs are matched back via ``custom_id`` labels
+    (``sub{i}:understand`` / ``sub{i}:counter``). For referenced_paragraphs,
+    evidence is gathered between the two jobs with the regular client.
+
+    Returns one BatchRunResult per submission, in input order.
+    """
+    results = [BatchRunResult() for _ in submissions]
+
+    with httpx.Client(
+        base_url=MISTRAL_BASE_URL,
+        headers={"Authorization": f"Bearer {settings.mistral_api_key}"},
+        timeout=60.0,
+    ) as http:
+        understand_bodies = {
+            f"sub{i}:understand": _batch_body(_understand_messages(sub), UnderstoodArguments, 0.2, 800)
+            for i, sub in enumerate(submissions)
+        }
+        understood_contents = _run_mistral_batch(http, understand_bodies, settings, poll_interval)
+
+        evidence_client: Any = None
+        counter_bodies: Dict[str, Dict[str, Any]] = {}
+        counter_models: Dict[str, Type[Any]] = {}
+        for i, sub in enumerate(submissions):
+            content = understood_contents.get(f"sub{i}:understand")
+            if content is None:
+                results[i].error = "understand request failed in batch"
+                continue
+            try:
+                understood = UnderstoodArguments.model_validate(json.loads(content))
+            except Exception as e:
+                results[i].error = f"understand stage failed: {e}"
+                continue
+            results[i].understood = understood
+
+            agent_side = opposite_side(sub.student_side)
+            if sub.requested_format == OutputFormat.referenced_paragraphs:
+                try:
+                    if evidence_client is None:
+                        evidence_client = build_client(settings)
+                    evidence = gather_evidence(
+                        motion=sub.motion,
+                        side=agent_side.value,
+                        tavily_api_key=settings.tavily_api_key,
+                        include_domains=settings.include_domains,
+                        search_depth=settings.search_depth,
+                        client=evidence_client,
+                        model=settings.model,
+                    )
+                    system = _evidence_based_system_prompt(sub, understood, agent_side, evidence)
+                except Exception as e:
+                    results[i].error = f"evidence stage failed: {e}"
+                    continue
+                response_model: Type[Any] = EvidenceBasedResponse
+                max_tokens = 1500
+            else:
+                system, response_model, max_tokens = _counter_request(sub, understood, agent_side)
+
+            counter_bodies[f"sub{i}:counter"] = _batch_body(
+                [{"role": "system", "content": system}], response_model, 0.1, max_tokens
+            )
+            counter_models[f"sub{i}:counter"] = response_model
+
+        counter_contents = _run_mistral_batch(http, counter_bodies, settings, poll_interval)
+
+    for custom_id, response_model in counter_models.items():
+        i = int(custom_id.split(":", 1)[0][len("sub"):])
+        content = counter_contents.get(custom_id)
+        if content is None:
+            results[i].error = "counter request failed in batch"
+            continue
+        try:
+            results[i].counter = response_model.model_validate(json.loads(content))
+        except Exception as e:
+            results[i].error = f"counter stage failed: {e}"
+
+    return results
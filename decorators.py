@@ -1,15 +1,41 @@
 import functools
+import inspect
 from typing import Any, Callable, Dict
 
-import logfire
+
+@functools.cache
+def _logfire() -> Any:
+    # Imported on first use so merely decorating functions stays cheap at startup.
+    import logfire
+
+    return logfire
+
+
+def log_debug(message: str, **attributes: Any) -> None:
+    """Emit a logfire debug event; ``message`` is a template over ``attributes``."""
+    _logfire().debug(message, **attributes)
+
+
+def log_warning(message: str, **attributes: Any) -> None:
+    """Emit a logfire warning event; ``message`` is a template over ``attributes``."""
+    _logfire().warn(message, **attributes)
 
 
 def span(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                attrs: Dict[str, Any] = kwargs.pop("span_attrs", {}) or {}
+                with _logfire().span(name, attributes=attrs):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             attrs: Dict[str, Any] = kwargs.pop("span_attrs", {}) or {}
-            with logfire.span(name, attributes=attrs):
+            with _logfire().span(name, attributes=attrs):
                 return func(*args, **kwargs)
 
         return wrapper
@@ -9,11 +9,14 @@ This module implements the evidence-first approach:
 """
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import asyncio
+import functools
+import textwrap
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from decorators import span
+from decorators import log_debug, log_warning, span
 
 
 class SearchResult(BaseModel):
@@ -33,18 +36,124 @@ class SourceSummary(BaseModel):
     relevance_to_topic: str = Field(description="How this source relates to the debate topic")
 
 
+class LabeledSourceSummary(SourceSummary):
+    """A source summary tagged with the id of the source it was produced from."""
+    id: str = Field(description="Id of the summarized source, e.g. 'text1'")
+
+
+class SourceSummaryList(BaseModel):
+    sources: List[LabeledSourceSummary]
+
+
+_SEARCH_RESULTS_ADAPTER = TypeAdapter(List[SearchResult])
+
+# Per-source snippet budget; Tavily snippets can run to several KB each.
+MAX_SNIPPET_CHARS = 800
+
+
 class GatheredEvidence(BaseModel):
     """Collection of verified evidence from web search."""
     query_used: str
     sources: List[SourceSummary]
 
 
+# Sources Tavily may return results from. A static policy, kept as an immutable
+# (and hashable, for the search cache) tuple; override via Settings.include_domains.
+DEFAULT_INCLUDE_DOMAINS: Tuple[str, ...] = (
+    "ncbi.nlm.nih.gov",
+    "pubmed.ncbi.nlm.nih.gov",
+    "nhtsa.gov",
+    "who.int",
+    "gov",
+    "edu",
+    "wikipedia.org",
+    "sciencedirect.com",
+    "nature.com",
+    "bmj.com",
+    "thelancet.com",
+)
+
+
+# Snippets are all summarization reads, so "basic" is the default; "advanced"
+# crawls deeper at several seconds and extra credits per search.
+SearchDepth = Literal["basic", "advanced"]
+
+
+def _search_query(motion: str, side: str) -> str:
+    if side == "pro":
+        return f"arguments supporting: {motion} evidence research studies"
+    return f"arguments against: {motion} evidence research studies criticism"
+
+
+def _search_params(
+    query: str,
+    max_results: int,
+    include_domains: Sequence[str],
+    search_depth: SearchDepth,
+) -> Dict[str, Any]:
+    return {
+        "query": query,
+        "search_depth": search_depth,
+        "max_results": max_results,
+        "include_raw_content": False,
+        # Let Tavily serve recently crawled results instead of re-crawling.
+        "use_cache": True,
+        "include_domains": list(include_domains),
+    }
+
+
+def _evidence_query(motion: str, side: str) -> str:
+    if side == "pro":
+        return f"arguments supporting: {motion}"
+    return f"arguments against: {motion}"
+
+
+def _shorten(content: str) -> str:
+    return textwrap.shorten(content, width=MAX_SNIPPET_CHARS, placeholder=" …")
+
+
+def _parse_search_results(response: Dict[str, Any]) -> List[SearchResult]:
+    # Validate the whole list in one pass of the compiled core schema.
+    return _SEARCH_RESULTS_ADAPTER.validate_python([
+        {
+            "title": r.get("title", ""),
+            "url": r.get("url", ""),
+            "content": r.get("content", ""),
+            "score": r.get("score", 0.0),
+        }
+        for r in response.get("results", [])
+    ])
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_search(
+    query: str,
+    tavily_api_key: str,
+    max_results: int,
+    include_domains: Tuple[str, ...],
+    search_depth: SearchDepth,
+) -> Tuple[SearchResult, ...]:
+    """
+    Run a Tavily search, memoized per process.
+    
+    Re-running the same motion and side (common while iterating on a
+    debate) skips the network round-trip entirely.
+    """
+    from tavily import TavilyClient
+    
+    client = TavilyClient(api_key=tavily_api_key)
+    response = client.search(**_search_params(query, max_results, include_domains, search_depth))
+    return tuple(_parse_search_results(response))
+
+
 @span("web_search")
 def search_web_for_evidence(
     motion: str,
     side: str,
     tavily_api_key: str,
     max_results: int = 8,
+    include_domains: Sequence[str] = DEFAULT_INCLUDE_DOMAINS,
+    search_depth: SearchDepth = "basic",
 ) -> List[SearchResult]:
     """
     Search the web for evidence related to the debate motion.
@@ -54,75 +163,63 @@ def search_web_for_evidence(
         side: Which side to search evidence for (pro/con)
         tavily_api_key: Tavily API key
         max_results: Maximum number of results to return
+        include_domains: Domains the search is restricted to
+        search_depth: Tavily search depth; "advanced" crawls deeper but is slower
     
     Returns:
         List of SearchResult with real URLs and content
     """
-    from tavily import TavilyClient
+    query = _search_query(motion, side)
     
-    client = TavilyClient(api_key=tavily_api_key)
+    log_debug("[evidence] Searching: {query}", query=query)
     
-    if side == "pro":
-        query = f"arguments supporting: {motion} evidence research studies"
-    else:
-        query = f"arguments against: {motion} evidence research studies criticism"
-    
-    print(f"[evidence] Searching: {query[:80]}...")
-    
-    response = client.search(
-        query=query,
-        search_depth="advanced",
-        max_results=max_results,
-        include_raw_content=False,
-        include_domains=[
-            "ncbi.nlm.nih.gov",
-            "pubmed.ncbi.nlm.nih.gov", 
-            "nhtsa.gov",
-            "who.int",
-            "gov",
-            "edu",
-            "wikipedia.org",
-            "sciencedirect.com",
-            "nature.com",
-            "bmj.com",
-            "thelancet.com",
-        ],
-    )
-    
-    results = []
-    for r in response.get("results", []):
-        results.append(SearchResult(
-            title=r.get("title", ""),
-            url=r.get("url", ""),
-            content=r.get("content", ""),
-            score=r.get("score", 0.0),
-        ))
+    results = list(_cached_search(query, tavily_api_key, max_results, tuple(include_domains), search_depth))
     
-    print(f"[evidence] Found {len(results)} sources")
+    log_debug("[evidence] Found {count} sources", count=len(results))
     return results
 
 
-@span("summarize_sources")
-def summarize_sources(
-    search_results: List[SearchResult],
+@span("web_search")
+async def search_web_for_evidence_async(
     motion: str,
     side: str,
-    client: Any,
-    model: str,
-) -> List[SourceSummary]:
+    tavily_api_key: str,
+    max_results: int = 8,
+    include_domains: Sequence[str] = DEFAULT_INCLUDE_DOMAINS,
+    search_depth: SearchDepth = "basic",
+) -> List[SearchResult]:
     """
-    Summarize each search result using the LLM.
+    Async variant of search_web_for_evidence.
     
-    This step extracts key claims and assesses relevance to the debate topic.
-    Each summary is tied to its real URL.
+    Runs the memoized blocking search in a worker thread so it can overlap
+    with LLM calls on the event loop while sharing the same result cache.
     """
-    if not search_results:
-        return []
+    query = _search_query(motion, side)
     
+    log_debug("[evidence] Searching: {query}", query=query)
+    
+    results = list(await asyncio.to_thread(
+        _cached_search, query, tavily_api_key, max_results, tuple(include_domains), search_depth
+    ))
+    
+    log_debug("[evidence] Found {count} sources", count=len(results))
+    return results
+
+
+def _source_id(index: int) -> str:
+    return f"text{index + 1}"
+
+
+def _summarize_messages(
+    search_results: List[SearchResult],
+    motion: str,
+    side: str,
+) -> List[Dict[str, str]]:
     sources_text = "\n\n".join([
-        f"Source {i+1}:\nTitle: {r.title}\nURL: {r.url}\nContent: {r.content}"
+        f"Source id={_source_id(i)}:\nTitle: {r.title}\nURL: {r.url}\nContent: {_shorten(r.content)}"
         for i, r in enumerate(search_results)
     ])
+    ids = ", ".join(_source_id(i) for i in range(len(search_results)))
     
     system = f"""You are a research assistant analyzing sources for a debate.
 Motion: {motion}
@@ -133,28 +230,175 @@ For each source provided, extract:
 2. Key claims or facts that can be used as evidence
 3. How this source relates to the debate topic
 
-Return a JSON object with a 'sources' array containing summaries for each source.
-Each source summary must include: url, title, summary, key_claims (array), relevance_to_topic.
+Return a JSON object with a 'sources' array holding one summary per source, in source order:
+[{{"id": "text1", ...}}, {{"id": "text2", ...}}, ...]
+Each source summary must include: id, url, title, summary, key_claims (array), relevance_to_topic.
+The source ids are: {ids}. Copy each id exactly from its "Source id=" label.
 IMPORTANT: Use the EXACT URLs provided - do not modify or fabricate URLs."""
 
-    class SourceSummaryList(BaseModel):
-        sources: List[SourceSummary]
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": sources_text},
+    ]
+
+
+def _align_by_id(
+    search_results: List[SearchResult],
+    labeled: List[LabeledSourceSummary],
+) -> List[SourceSummary]:
+    """
+    Match batched summaries back to their sources by id.
     
-    print(f"[evidence] Summarizing {len(search_results)} sources...")
+    Unknown or repeated ids are dropped, so a partial or reordered response
+    still yields correctly attributed summaries in source order.
+    """
+    by_id: Dict[str, LabeledSourceSummary] = {}
+    for summary in labeled:
+        by_id.setdefault(summary.id.strip(), summary)
+    
+    aligned: List[SourceSummary] = []
+    for i, r in enumerate(search_results):
+        summary = by_id.get(_source_id(i))
+        if summary is None:
+            continue
+        aligned.append(SourceSummary(
+            url=r.url,
+            title=summary.title or r.title,
+            summary=summary.summary,
+            key_claims=summary.key_claims,
+            relevance_to_topic=summary.relevance_to_topic,
+        ))
+    return aligned
+
+
+@span("summarize_sources")
+def summarize_sources(
+    search_results: List[SearchResult],
+    motion: str,
+    side: str,
+    client: Any,
+    model: str,
+) -> List[SourceSummary]:
+    """
+    Summarize each search result using the LLM.
+    
+    This step extracts key claims and assesses relevance to the debate topic.
+    Each summary is tied to its real URL. Raises ValueError if no source
+    could be summarized.
+    """
+    if not search_results:
+        return []
+    
+    log_debug("[evidence] Summarizing {count} sources", count=len(search_results))
     
     result: SourceSummaryList = client.chat.completions.create(
         model=model,
-        messages=[
-            {"role": "system", "content": system},
-            {"role": "user", "content": sources_text},
-        ],
+        messages=_summarize_messages(search_results, motion, side),
         temperature=0.1,
         max_tokens=2000,
         response_model=SourceSummaryList,
         max_retries=2,
     )
     
-    return result.sources
+    summaries = _align_by_id(search_results, result.sources)
+    if not summaries:
+        raise ValueError(
+            f"Web search returned {len(search_results)} sources but none could be summarized"
+        )
+    return summaries
+
+
+def _summarize_one_messages(
+    result: SearchResult,
+    motion: str,
+    side: str,
+) -> List[Dict[str, str]]:
+    system = f"""You are a research assistant analyzing a source for a debate.
+Motion: {motion}
+Side being argued: {side}
+
+For the source provided, extract:
+1. A concise summary of the main points
+2. Key claims or facts that can be used as evidence
+3. How this source relates to the debate topic
+
+Return a JSON object with: url, title, summary, key_claims (array), relevance_to_topic.
+IMPORTANT: Use the EXACT URL provided - do not modify or fabricate URLs."""
+
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": f"Title: {result.title}\nURL: {result.url}\nContent: {_shorten(result.content)}"},
+    ]
+
+
+async def _summarize_one_async(
+    result: SearchResult,
+    motion: str,
+    side: str,
+    client: Any,
+    model: str,
+) -> SourceSummary:
+    summary: SourceSummary = await client.chat.completions.create(
+        model=model,
+        messages=_summarize_one_messages(result, motion, side),
+        temperature=0.1,
+        max_tokens=400,
+        response_model=SourceSummary,
+        max_retries=2,
+    )
+    # Pin the summary to the source it was produced from, whatever the model echoed back.
+    summary.url = result.url
+    summary.title = summary.title or result.title
+    return summary
+
+
+@span("summarize_sources")
+async def summarize_sources_async(
+    search_results: List[SearchResult],
+    motion: str,
+    side: str,
+    client: Any,
+    model: str,
+    max_concurrency: int = 4,
+) -> List[SourceSummary]:
+    """
+    Async variant of summarize_sources; expects an async instructor client.
+    
+    Each source is summarized in its own small LLM call, at most
+    ``max_concurrency`` at a time. Sources whose summary fails are dropped;
+    the remaining summaries keep the search result order. Raises ValueError
+    if every summary fails.
+    """
+    if not search_results:
+        return []
+    
+    log_debug("[evidence] Summarizing {count} sources", count=len(search_results))
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded(r: SearchResult) -> SourceSummary:
+        async with semaphore:
+            return await _summarize_one_async(r, motion, side, client, model)
+
+    outcomes = await asyncio.gather(
+        *[bounded(r) for r in search_results],
+        return_exceptions=True,
+    )
+    
+    summaries: List[SourceSummary] = []
+    first_error: Optional[BaseException] = None
+    for r, outcome in zip(search_results, outcomes):
+        if isinstance(outcome, BaseException):
+            log_warning("[evidence] Failed to summarize {url}: {error}", url=r.url, error=str(outcome))
+            first_error = first_error or outcome
+            continue
+        summaries.append(outcome)
+    
+    if not summaries:
+        raise ValueError(
+            f"Web search returned {len(search_results)} sources but none could be summarized: {first_error}"
+        ) from first_error
+    return summaries
 
 
 @span("gather_evidence")
@@ -164,6 +408,8 @@ def gather_evidence(
     tavily_api_key: Optional[str],
     client: Any,
     model: str,
+    include_domains: Sequence[str] = DEFAULT_INCLUDE_DOMAINS,
+    search_depth: SearchDepth = "basic",
 ) -> GatheredEvidence:
     """
     Main evidence gathering pipeline:
@@ -175,26 +421,23 @@ def gather_evidence(
     If no Tavily API key is provided, returns empty evidence.
     """
     if not tavily_api_key:
-        print("[evidence] No TAVILY_API_KEY set - skipping web search")
+        log_debug("[evidence] No TAVILY_API_KEY set - skipping web search")
         return GatheredEvidence(
             query_used="",
             sources=[],
         )
     
-    if side == "pro":
-        query = f"arguments supporting: {motion}"
-    else:
-        query = f"arguments against: {motion}"
-    
     search_results = search_web_for_evidence(
         motion=motion,
         side=side,
         tavily_api_key=tavily_api_key,
+        include_domains=include_domains,
+        search_depth=search_depth,
     )
     
     if not search_results:
-        print("[evidence] No search results found")
-        return GatheredEvidence(query_used=query, sources=[])
+        log_debug("[evidence] No search results found")
+        return GatheredEvidence(query_used=_evidence_query(motion, side), sources=[])
     
     summaries = summarize_sources(
         search_results=search_results,
@@ -204,7 +447,76 @@ def gather_evidence(
         model=model,
     )
     
-    print(f"[evidence] Gathered {len(summaries)} verified sources")
+    log_debug("[evidence] Gathered {count} verified sources", count=len(summaries))
+    
+    return GatheredEvidence(
+        query_used=_evidence_query(motion, side),
+        sources=summaries,
+    )
+
+
+@span("gather_evidence")
+async def gather_evidence_async(
+    motion: str,
+    side: str,
+    tavily_api_key: Optional[str],
+    client: Any,
+    model: str,
+    include_domains: Sequence[str] = DEFAULT_INCLUDE_DOMAINS,
+    search_depth: SearchDepth = "basic",
+) -> GatheredEvidence:
+    """Async variant of gather_evidence; expects an async instructor client."""
+    if not tavily_api_key:
+        log_debug("[evidence] No TAVILY_API_KEY set - skipping web search")
+        return GatheredEvidence(
+            query_used="",
+            sources=[],
+        )
+    
+    search_results = await search_web_for_evidence_async(
+        motion=motion,
+        side=side,
+        tavily_api_key=tavily_api_key,
+        include_domains=include_domains,
+        search_depth=search_depth,
+    )
+    return await build_evidence_async(
+        search_results=search_results,
+        motion=motion,
+        side=side,
+        client=client,
+        model=model,
+    )
+
+
+async def build_evidence_async(
+    search_results: List[SearchResult],
+    motion: str,
+    side: str,
+    client: Any,
+    model: str,
+) -> GatheredEvidence:
+    """
+    Summarize already-fetched search results into verified evidence.
+    
+    Split out from gather_evidence_async so callers can run the web search
+    concurrently with other work and summarize once it lands.
+    """
+    query = _evidence_query(motion, side)
+    
+    if not search_results:
+        log_debug("[evidence] No search results found")
+        return GatheredEvidence(query_used=query, sources=[])
+    
+    summaries = await summarize_sources_async(
+        search_results=search_results,
+        motion=motion,
+        side=side,
+        client=client,
+        model=model,
+    )
+    
+    log_debug("[evidence] Gathered {count} verified sources", count=len(summaries))
     
     return GatheredEvidence(
         query_used=query,
@@ -1,18 +1,17 @@
 import argparse
-from typing import Union
+import asyncio
+from typing import Optional, Union
 
-from settings import Settings
+from settings import Settings, get_settings
 from models import (
     DebateSide,
     OutputFormat,
     StudentSubmission,
-    UnderstoodArguments,
     PointsResponse,
     RebuttalParagraphs,
     ReferencedParagraphs,
     EvidenceBasedResponse,
 )
-from agent import build_client, understand_arguments, generate_counter
 
 
 def parse_args():
@@ -22,6 +21,7 @@ def parse_args():
     p.add_argument("--format", dest="fmt", choices=[f.value for f in OutputFormat], required=True)
     p.add_argument("--argument", help="Student's argument text")
     p.add_argument("--argument_file", help="Path to a text file containing the student's argument")
+    p.add_argument("--verbose", action="store_true", help="Print pipeline progress and debug logs")
     return p.parse_args()
 
 
@@ -34,13 +34,79 @@ def read_argument_text(arg: str | None, path: str | None) -> str:
     raise SystemExit("Provide --argument or --argument_file")
 
 
-def main():
-    settings = Settings()
-    settings.init_observability()
+async def run(
+    submission: StudentSubmission, settings: Settings, verbose: bool = False
+) -> Optional[Union[PointsResponse, RebuttalParagraphs, ReferencedParagraphs, EvidenceBasedResponse]]:
+    """Run the pipeline; returns None when the result was already streamed to stdout."""
+    # Deferred so `--help` and argument errors don't pay for the LLM/HTTP stack.
+    from agent import (
+        analyze_and_counter_async,
+        build_async_client,
+        generate_counter_async,
+        opposite_side,
+        stream_rebuttal_paragraphs_async,
+    )
+
+    def progress(message: str) -> None:
+        if verbose:
+            print(message)
+
+    client = build_async_client(settings)
+    agent_side = opposite_side(submission.student_side)
+    counter_attrs = {
+        "motion": submission.motion,
+        "student_side": submission.student_side.value,
+        "agent_side": agent_side.value,
+        "format": submission.requested_format.value,
+    }
+
+    if submission.requested_format == OutputFormat.rebuttal_paragraphs:
+        # Plain paragraphs can be shown as they arrive instead of after the whole completion.
+        import logfire
+
+        progress("[understand+counter] start")
+        # Entered and exited here, in the task that consumes the stream.
+        with logfire.span("analyze_and_counter", attributes=counter_attrs):
+            async for para in stream_rebuttal_paragraphs_async(
+                submission=submission,
+                client=client,
+                settings=settings,
+            ):
+                print(f"\n{para}\n")
+        progress("[understand+counter] done")
+        return None
+
+    if submission.requested_format != OutputFormat.referenced_paragraphs:
+        # Nothing has to be gathered between understanding and countering, so one call does both.
+        progress("[understand+counter] start")
+        combined = await analyze_and_counter_async(
+            submission=submission,
+            client=client,
+            settings=settings,
+            span_attrs=counter_attrs,
+        )
+        progress("[understand+counter] done")
+        return combined.counter
+
+    # Understanding runs inside generate_counter_async, concurrently with gathering evidence.
+    progress("[counter] start")
+    result = await generate_counter_async(
+        submission=submission,
+        understood=None,
+        client=client,
+        settings=settings,
+        span_attrs=counter_attrs,
+    )
+    progress("[counter] done")
+    return result
 
-    client = build_client(settings)
 
+def main():
     args = parse_args()
+
+    settings = get_settings()
+    settings.init_observability(verbose=args.verbose)
+
     argument_text = read_argument_text(args.argument, args.argument_file)
 
     submission = StudentSubmission(
@@ -51,36 +117,18 @@ def main():
     )
 
     try:
-        print("[understand] start")
-        understood: UnderstoodArguments = understand_arguments(
-            submission=submission,
-            client=client,
-            settings=settings,
-            span_attrs={
-                "motion": submission.motion,
-                "student_side": submission.student_side.value,
-            },
-        )
-        print("[understand] done")
-
-        print("[counter] start")
-        result: Union[PointsResponse, RebuttalParagraphs, ReferencedParagraphs, EvidenceBasedResponse] = generate_counter(
-            submission=submission,
-            understood=understood,
-            client=client,
-            settings=settings,
-            span_attrs={
-                "motion": submission.motion,
-                "student_side": submission.student_side.value,
-                "agent_side": ("con" if submission.student_side.value == "pro" else "pro"),
-                "format": submission.requested_format.value,
-            },
-        )
-        print("[counter] done")
+        result = asyncio.run(run(submission, settings, verbose=args.verbose))
     except Exception as e:
         print("[error]", str(e))
         raise
 
+    if result is not None:
+        print_result(result)
+
+
+def print_result(
+    result: Union[PointsResponse, RebuttalParagraphs, ReferencedParagraphs, EvidenceBasedResponse],
+) -> None:
     if isinstance(result, PointsResponse):
         for i, cp in enumerate(result.points, start=1):
             print(f"{i}. {cp.point}")
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 
-import httpx
-from pydantic import BaseModel, Field, AnyUrl, field_validator, model_validator
+from pydantic import BaseModel, Field, AnyUrl, model_validator
+
+if TYPE_CHECKING:
+    import diskcache
+    import httpx
 
 
 class DebateSide(str, Enum):
@@ -52,46 +60,114 @@ class RebuttalParagraphs(BaseModel):
     paragraphs: List[str]
 
 
+class CombinedResponse(BaseModel):
+    """Understanding and counter produced by a single LLM call."""
+    understood: UnderstoodArguments
+
+
+class CombinedPointsResponse(CombinedResponse):
+    counter: PointsResponse
+
+
+class CombinedRebuttalResponse(CombinedResponse):
+    counter: RebuttalParagraphs
+
+
 class Reference(BaseModel):
     title: Optional[str] = None
     url: AnyUrl
 
-    @field_validator("url")
-    @classmethod
-    def validate_url_returns_200(cls, v: AnyUrl) -> AnyUrl:
-        """Ensure the URL returns a 200 status code."""
-        url_str = str(v)
+
+_URL_CHECK_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+_MAX_URL_CHECKS = 20
+
+
+@functools.cache
+def _http_client() -> httpx.Client:
+    """
+    One pooled client for every reference check in the process, so repeated
+    hosts reuse kept-alive (and HTTP/2 multiplexed) connections.
+
+    Created on first use so formats without references never import httpx.
+    """
+    import httpx
+
+    client = httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        timeout=10.0,
+        headers=_URL_CHECK_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=_MAX_URL_CHECKS, max_connections=_MAX_URL_CHECKS),
+    )
+    atexit.register(client.close)
+    return client
+
+
+URL_CACHE_DIR = os.path.expanduser("~/.cache/debateagent/url")
+_URL_OK_TTL = 24 * 60 * 60
+_URL_MISSING_TTL = 60 * 60
+
+
+@functools.cache
+def _url_cache() -> diskcache.Cache:
+    """On-disk cache of URL -> last observed status code, shared across runs."""
+    import diskcache
+
+    return diskcache.Cache(URL_CACHE_DIR)
+
+
+def _raise_for_status(url_str: str, status_code: int) -> None:
+    # Many authoritative sources block non-browser clients and return 401/403.
+    # Treat those as "reachable" but still reject missing resources.
+    if status_code in (404, 410):
+        raise ValueError(f"URL '{url_str}' returned status {status_code}")
+    if status_code >= 400 and status_code not in (401, 403):
+        raise ValueError(f"URL '{url_str}' returned status {status_code}")
+
+
+def _check_url(url_str: str) -> None:
+    """Ensure the URL is reachable, raising ValueError otherwise."""
+    import httpx
+
+    cache = _url_cache()
+    status_code = cache.get(url_str)
+    if status_code is None:
+        client = _http_client()
         try:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            }
-            response = httpx.head(
-                url_str,
-                timeout=10.0,
-                follow_redirects=True,
-                headers=headers,
-            )
+            response = client.head(url_str)
             if response.status_code >= 400:
-                response = httpx.get(
-                    url_str,
-                    timeout=10.0,
-                    follow_redirects=True,
-                    headers=headers,
-                )
-
-            # Many authoritative sources block non-browser clients and return 401/403.
-            # Treat those as "reachable" but still reject missing resources.
-            if response.status_code in (404, 410):
-                raise ValueError(f"URL '{url_str}' returned status {response.status_code}")
-            if response.status_code >= 400 and response.status_code not in (401, 403):
-                raise ValueError(f"URL '{url_str}' returned status {response.status_code}")
+                response = client.get(url_str)
         except httpx.RequestError as e:
             raise ValueError(f"Failed to reach URL '{url_str}': {e}") from e
-        return v
+        status_code = response.status_code
+
+        # Remember reachable URLs for a day and missing ones for an hour;
+        # other failures are likely transient and are re-checked next time.
+        if status_code < 400 or status_code in (401, 403):
+            cache.set(url_str, status_code, expire=_URL_OK_TTL)
+        elif status_code in (404, 410):
+            cache.set(url_str, status_code, expire=_URL_MISSING_TTL)
+
+    _raise_for_status(url_str, status_code)
+
+
+def validate_urls_return_200(urls: List[str]) -> None:
+    """
+    Ensure every URL is reachable, raising ValueError for the first that is not.
+
+    URLs are checked concurrently on a thread pool over the shared client.
+    """
+    if not urls:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(urls), _MAX_URL_CHECKS)) as pool:
+        list(pool.map(_check_url, urls))
 
 
 class ReferencedParagraph(BaseModel):
@@ -104,17 +180,23 @@ class ReferencedParagraphs(BaseModel):
 
     @model_validator(mode="after")
     def ensure_unique_urls_across_paragraphs(self) -> "ReferencedParagraphs":
-        seen: set[str] = set()
         for idx, p in enumerate(self.paragraphs):
             if not p.references:
                 raise ValueError(f"paragraphs.{idx}.references must not be empty")
-            for r in p.references:
-                url_str = str(r.url)
-                if url_str in seen:
-                    raise ValueError(
-                        f"Duplicate reference URL across paragraphs is not allowed: {url_str}"
-                    )
-                seen.add(url_str)
+        urls = [str(r.url) for p in self.paragraphs for r in p.references]
+        if len(urls) != len(set(urls)):
+            duplicate, _ = Counter(urls).most_common(1)[0]
+            raise ValueError(
+                f"Duplicate reference URL across paragraphs is not allowed: {duplicate}"
+            )
+        return self
+
+    # Declared after the uniqueness check so a response with duplicates is
+    # rejected before any network request is made.
+    @model_validator(mode="after")
+    def validate_reference_urls(self) -> "ReferencedParagraphs":
+        urls = [str(r.url) for p in self.paragraphs for r in p.references]
+        validate_urls_return_200(list(dict.fromkeys(urls)))
         return self
 
 
@@ -140,12 +222,17 @@ class EvidenceBasedResponse(BaseModel):
 
     @model_validator(mode="after")
     def ensure_unique_urls_across_paragraphs(self) -> "EvidenceBasedResponse":
-        seen: set[str] = set()
-        for p in self.paragraphs:
-            for r in p.references:
-                if r.url in seen:
-                    raise ValueError(
-                        f"Duplicate reference URL across paragraphs: {r.url}"
-                    )
-                seen.add(r.url)
+        urls = [r.url for p in self.paragraphs for r in p.references]
+        if len(urls) != len(set(urls)):
+            duplicate, _ = Counter(urls).most_common(1)[0]
+            raise ValueError(
+                f"Duplicate reference URL across paragraphs: {duplicate}"
+            )
         return self
+
+
+class BatchRunResult(BaseModel):
+    """Outcome of one submission in a batch run; ``error`` is set when a stage failed."""
+    understood: Optional[UnderstoodArguments] = None
+    counter: Optional[Union[PointsResponse, RebuttalParagraphs, EvidenceBasedResponse]] = None
+    error: Optional[str] = None
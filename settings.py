@@ -1,8 +1,14 @@
-from typing import Optional
+import functools
+import os
+from typing import Optional, Tuple
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
-import logfire
+
+from evidence import DEFAULT_INCLUDE_DOMAINS, SearchDepth
+
+
+_instrumented = False
 
 
 class Settings(BaseSettings):
@@ -11,13 +17,50 @@ class Settings(BaseSettings):
     logfire_token: Optional[str] = Field(default=None, alias="LOGFIRE_TOKEN")
     environment: str = Field(default="dev", alias="ENVIRONMENT")
     tavily_api_key: Optional[str] = Field(default=None, alias="TAVILY_API_KEY")
+    # JSON list in the environment, e.g. INCLUDE_DOMAINS='["who.int", "edu"]'
+    include_domains: Tuple[str, ...] = Field(default=DEFAULT_INCLUDE_DOMAINS, alias="INCLUDE_DOMAINS")
+    search_depth: SearchDepth = Field(default="basic", alias="TAVILY_SEARCH_DEPTH")
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="ignore", case_sensitive=False
     )
 
-    def init_observability(self) -> None:
+    def init_observability(self, verbose: bool = False) -> None:
+        global _instrumented
+        import logfire
+
+        # Pipeline diagnostics are debug events; only show them on the console when asked.
+        console = logfire.ConsoleOptions(min_log_level="debug" if verbose else "info")
         if self.logfire_token:
-            logfire.configure(token=self.logfire_token, service_name="ai_eng_ii_assign_01", environment=self.environment)
+            logfire.configure(
+                token=self.logfire_token,
+                service_name="ai_eng_ii_assign_01",
+                environment=self.environment,
+                console=console,
+            )
         else:
-            logfire.configure(service_name="ai_eng_ii_assign_01", environment=self.environment)
+            logfire.configure(service_name="ai_eng_ii_assign_01", environment=self.environment, console=console)
+        # instrument_openai patches the SDK globally; patching again would stack wrappers.
+        if not _instrumented:
+            try:
+                logfire.instrument_openai()
+            except Exception:
+                pass
+            _instrumented = True
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """
+    Process-wide Settings, parsed once.
+
+    The .env file is only read when the environment does not already define
+    every setting. Skipping it as soon as the required MISTRAL_API_KEY is
+    exported would silently drop optional values (e.g. TAVILY_API_KEY) that
+    live only in .env.
+    """
+    env_keys = {k.upper() for k in os.environ}
+    aliases = {(f.alias or name).upper() for name, f in Settings.model_fields.items()}
+    if aliases <= env_keys:
+        return Settings(_env_file=None)
+    return Settings()